@@ -5,7 +5,7 @@ a = Analysis(
     ['excel_slimmer_qt.py'],
     pathex=['.', 'backData'],
     binaries=[],
-    datas=[('check_white.svg', '.')],
+    datas=[('check_white.svg', '.'), ('themes', 'themes')],
     hiddenimports=[
         'gui_clean_defined_names_desktop_date',
         'excel_image_slimmer_gui_v3',
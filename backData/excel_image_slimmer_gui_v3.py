@@ -178,7 +178,9 @@ class ProgressUI:
 
 def open_in_explorer_select(path: Path):
     try:
-        subprocess.run(["explorer", "/select,", str(path)], check=False)
+        # run()은 탐색기 창이 뜰 때까지 수백 ms 블로킹될 수 있으므로
+        # Popen으로 띄워만 놓고 바로 돌아온다 (결과 코드는 어차피 안 본다).
+        subprocess.Popen(["explorer", "/select,", str(path)])
     except Exception:
         try:
             os.startfile(path.parent)  # type: ignore[attr-defined]
@@ -1,9 +1,11 @@
+import multiprocessing
+import queue
 import sys
-import threading
+from collections import deque
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QObject, Signal
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QObject, QSignalBlocker, QThread, QTimer, Signal
+from PySide6.QtGui import QFont, QIntValidator
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -37,13 +39,104 @@ def _ensure_module_paths() -> None:
 
 _ensure_module_paths()
 
-from excel_suite_pipeline import run_pipeline_core, open_in_explorer_select
+# excel_suite_pipeline 은 openpyxl/Pillow 등 무거운 의존성을 끌고 들어오므로
+# 여기서 eager import 하지 않고, 실제 파이프라인 실행 시점에 지연 import 한다.
+# 창이 먼저 뜨고, 무거운 모듈 로딩은 사용자가 "슬리머 실행"을 누른 뒤 일어난다.
 from settings import get_settings, save_settings
 
 
+# 경로 상수는 모듈 로드 시 한 번만 계산한다 (resolve()는 stat 시스템콜을 수반).
+# 파이프라인이 처리할 수 있는 입력 확장자
+_ALLOWED_SUFFIXES = frozenset({".xlsx", ".xlsm"})
+
+_BASE_DIR = Path(__file__).resolve().parent
+_THEMES_DIR = _BASE_DIR / "themes"
+_CHECK_ICON = str(_BASE_DIR / "check_white.svg").replace("\\", "/")
+
+
+def _load_theme_qss(theme: str) -> str:
+    """themes/<theme>.qss 테마 파일을 읽어 체크 아이콘 경로를 치환해서 반환한다."""
+
+    qss = (_THEMES_DIR / f"{theme}.qss").read_text(encoding="utf-8")
+    return qss.replace("{CHECK_ICON}", _CHECK_ICON)
+
+
+def _run_pipeline_in_process(path_str: str, options: dict, app_settings, events) -> None:
+    """별도 프로세스에서 파이프라인 코어를 실행한다 (multiprocessing.Process 용).
+
+    UI 콜백은 전부 이벤트 큐로 직렬화해서 보내고, 메인 프로세스의 타이머가
+    큐를 비우면서 화면을 갱신한다. spawn 방식에서도 동작하도록 모듈 최상위
+    함수로 두고, 인자는 피클 가능한 타입만 받는다.
+    """
+
+    from settings import set_settings
+
+    # 워커 프로세스는 실행 간에 재사용되고 get_settings() 는 프로세스당
+    # 한 번만 디스크를 읽으므로, 부모가 보낸 AppSettings 스냅샷을 캐시에
+    # 심어 이번 실행의 최신 값이 쓰이게 한다.
+    set_settings(app_settings)
+
+    from excel_suite_pipeline import run_pipeline_core
+
+    last_progress = 0.0
+
+    def log_cb(msg: str) -> None:
+        events.put(("log", msg))
+
+    def set_status_cb(text: str, progress: float | None) -> None:
+        nonlocal last_progress
+        if progress is not None:
+            last_progress = progress
+        events.put(("status", text, last_progress))
+
+    def show_error_cb(title: str, text: str) -> None:
+        events.put(("failed", text))
+
+    def on_finished_cb(final_path: Path) -> None:
+        events.put(("finished", str(final_path)))
+
+    try:
+        run_pipeline_core(
+            start_path=Path(path_str),
+            log=log_cb,
+            set_status=set_status_cb,
+            show_error=show_error_cb,
+            on_finished=on_finished_cb,
+            **options,
+        )
+    except Exception as e:  # noqa: BLE001
+        events.put(("failed", f"예기치 못한 오류: {e}"))
+
+
+class _ClampIntValidator(QIntValidator):
+    """범위 밖/빈 입력을 항상 유효한 값으로 고쳐 주는 QIntValidator.
+
+    기본 QIntValidator 는 최소값 미만 입력(예: 1400~4000 범위의 "700")과
+    빈 문자열을 Intermediate 로 두고, Intermediate 상태의 편집창은 포커스를
+    잃어도 editingFinished 를 emit 하지 않아 적용되지 않은 값이 화면에 남는다.
+    fixup 이 숫자는 범위 안으로 클램프하고 빈 입력은 fallback(짝이 되는
+    슬라이더의 현재 값)으로 되돌리면 입력이 항상 Acceptable 이 되어
+    핸들러가 반드시 실행된다.
+    """
+
+    def __init__(self, bottom: int, top: int, fallback, parent=None) -> None:
+        super().__init__(bottom, top, parent)
+        self._fallback = fallback
+
+    def fixup(self, text: str) -> str:
+        try:
+            value = int(text.strip())
+        except ValueError:
+            # 빈/깨진 입력은 현재 슬라이더 값으로 복구한다.
+            return str(self._fallback())
+        return str(max(self.bottom(), min(self.top(), value)))
+
+
 class PipelineWorker(QObject):
-    log = Signal(str)
-    status = Signal(str, float)
+    # 진행률과 상태 텍스트를 분리된 시그널로 보낸다. 진행률은 int 하나만
+    # 마샬링하면 되고, 각 시그널은 값이 실제로 바뀔 때만 emit 된다.
+    progress = Signal(int)
+    status_text = Signal(str)
     finished = Signal(str)
     failed = Signal(str)
 
@@ -67,6 +160,24 @@ class PipelineWorker(QObject):
         self.do_xml_cleanup = do_xml_cleanup
         self.force_custom = force_custom
 
+        # 로그는 라인마다 시그널을 emit하지 않고 버퍼에 모아 두고,
+        # UI 쪽 타이머가 주기적으로 꺼내 가서 한 번에 출력한다.
+        # deque 의 append/popleft 는 GIL 아래에서 원자적이라 락이 필요 없다.
+        self._log_buf: deque[str] = deque()
+
+    def take_pending_logs(self) -> list[str]:
+        """버퍼에 쌓인 로그 라인들을 비우면서 가져온다 (UI 스레드에서 호출).
+
+        popleft 로 하나씩 빼내므로 드레인 도중 워커가 append 해도 안전하다
+        (그 라인은 다음 드레인 때 가져간다).
+        """
+
+        buf = self._log_buf
+        batch: list[str] = []
+        while buf:
+            batch.append(buf.popleft())
+        return batch
+
     def run(self) -> None:
         """Run the shared pipeline core in a worker thread.
 
@@ -74,16 +185,24 @@ class PipelineWorker(QObject):
         tkinter 버전과 완전히 동일한 파이프라인 로직을 재사용합니다.
         """
 
-        last_progress = 0.0
+        from excel_suite_pipeline import run_pipeline_core
+
+        last_progress = -1
+        last_text = ""
 
         def log_cb(msg: str) -> None:
-            self.log.emit(msg)
+            self._log_buf.append(msg)
 
         def set_status_cb(text: str, progress: float | None) -> None:
-            nonlocal last_progress
+            nonlocal last_progress, last_text
             if progress is not None:
-                last_progress = progress
-            self.status.emit(text, last_progress)
+                value = int(progress)
+                if value != last_progress:
+                    last_progress = value
+                    self.progress.emit(value)
+            if text != last_text:
+                last_text = text
+                self.status_text.emit(text)
 
         def show_error_cb(title: str, text: str) -> None:
             # 실제 메시지 박스는 메인 스레드에서 처리하도록 failed 시그널로 위임
@@ -111,6 +230,10 @@ class PipelineWorker(QObject):
 
 
 class MainWindow(QMainWindow):
+    # 슬라이더와 연동되는 라벨의 고정 접두사 (매 틱마다 문자열을 새로 만들지 않는다)
+    _MAX_EDGE_PREFIX = "최대 해상도 (px): "
+    _QUALITY_PREFIX = "JPEG 품질: "
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("ExcelSlimmer")
@@ -119,9 +242,43 @@ class MainWindow(QMainWindow):
         self._settings = get_settings()
         self._theme = self._settings.theme
 
-        self._worker_thread: threading.Thread | None = None
+        # 파일 찾기 대화상자의 시작 폴더는 시작 시 한 번만 확인해 둔다.
+        # (클릭할 때마다 바탕 화면 경로를 stat 하지 않는다.)
+        default_dir = Path.home() / "Desktop"
+        self._default_browse_dir = str(default_dir) if default_dir.exists() else ""
+
+        # 테마 QSS는 시작 시 한 번만 읽어 두고, 토글 시에는 캐시 문자열만 적용한다.
+        self._qss = {name: _load_theme_qss(name) for name in ("light", "dark")}
+
+        self._worker_thread: QThread | None = None
         self._worker: PipelineWorker | None = None
 
+        # CPU 바운드 파이프라인은 별도 프로세스에서 실행해 GIL 경합을 없앤다.
+        # 데몬 프로세스로 띄워 창이 닫히면 파이프라인도 함께 내려가게 하고,
+        # 매니저는 첫 실행 시점에 만들어 시작 시간을 지연시키지 않는다.
+        self._proc: multiprocessing.Process | None = None
+        self._manager = None  # multiprocessing.Manager (첫 실행 시 생성)
+        self._events = None
+        self._event_drain_timer = QTimer(self)
+        self._event_drain_timer.setInterval(30)
+        self._event_drain_timer.timeout.connect(self._drain_pipeline_events)
+
+        # 설정 저장은 디바운스로 모아서 기록한다. 슬라이더 드래그처럼 짧은 시간에
+        # 값이 연속으로 바뀌는 동안에는 디스크를 건드리지 않고, 입력이 멈춘 뒤
+        # 250ms 후에 한 번만 save_settings 를 호출한다.
+        self._settings_debounce = QTimer(self)
+        self._settings_debounce.setSingleShot(True)
+        self._settings_debounce.setInterval(250)
+        self._settings_debounce.timeout.connect(self._commit_settings)
+
+        # 상태 라벨/진행바 갱신도 약 30Hz로 묶는다. 파이프라인이 셀 단위로
+        # 상태를 쏟아내도 마지막 값만 남겨 뒀다가 한 번에 반영한다.
+        self._pending_status: tuple[str, float | None] | None = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(33)
+        self._status_timer.timeout.connect(self._apply_pending_status)
+
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -149,6 +306,12 @@ class MainWindow(QMainWindow):
         tabs.addTab(self.pipeline_tab, "슬리머 실행")
         tabs.addTab(self.settings_tab, "환경 설정")
 
+        # 환경 설정 탭은 대부분의 세션에서 열리지 않으므로 지연 생성한다.
+        # 처음 탭을 눌렀을 때 _build_settings_tab 이 실제 위젯들을 만든다.
+        self.tabs = tabs
+        self._settings_built = False
+        tabs.currentChanged.connect(self._ensure_settings_built)
+
         pipe_layout = QGridLayout(self.pipeline_tab)
         # 좌우는 12px, 상단은 약간 내려서 슬리머 실행 탭 상단과 라벨 사이 간격을 확보
         pipe_layout.setContentsMargins(12, 8, 12, 0)
@@ -172,11 +335,11 @@ class MainWindow(QMainWindow):
 
         # 대상 파일 카드
         file_label = QLabel("대상 파일")
-        file_label.setStyleSheet("font-weight: 600;")
+        file_label.setProperty("class", "header")
         left_layout.addWidget(file_label)
 
         file_group = QGroupBox()
-        file_group.setStyleSheet(self._card_style())
+        file_group.setProperty("card", True)
         fg_layout = QVBoxLayout(file_group)
         fg_layout.setSpacing(6)
 
@@ -197,15 +360,15 @@ class MainWindow(QMainWindow):
 
         # 실행할 기능 카드
         func_label = QLabel("실행할 기능")
-        func_label.setStyleSheet("font-weight: 600;")
+        func_label.setProperty("class", "header")
         left_layout.addWidget(func_label)
 
         func_group = QGroupBox()
-        func_group.setStyleSheet(self._card_style())
+        func_group.setProperty("card", True)
         func_layout = QVBoxLayout(func_group)
         func_layout.setSpacing(4)
 
-        settings = get_settings()
+        settings = self._settings
         self.clean_check = QCheckBox("이름 정의 정리")
         self.clean_check.setFocusPolicy(Qt.NoFocus)
         self.clean_check.setCursor(Qt.PointingHandCursor)
@@ -221,7 +384,7 @@ class MainWindow(QMainWindow):
         # 이미지 최적화 체크박스 및 해상도/품질 설정 (슬라이더 + 직접 입력)
         func_layout.addWidget(self.image_check)
 
-        self.max_edge_label = QLabel(f"최대 해상도 (px): {settings.image_max_edge}")
+        self.max_edge_label = QLabel(f"{self._MAX_EDGE_PREFIX}{settings.image_max_edge}")
         self.max_edge_slider = QSlider(Qt.Horizontal)
         self.max_edge_slider.setCursor(Qt.PointingHandCursor)
         self.max_edge_slider.setRange(1400, 4000)
@@ -234,14 +397,26 @@ class MainWindow(QMainWindow):
         self.max_edge_edit.setMaxLength(4)
         self.max_edge_edit.setFrame(True)
         self.max_edge_edit.setCursor(Qt.PointingHandCursor)
-        self.max_edge_edit.editingFinished.connect(self._on_max_edge_edit_finished)
+        # 범위 밖/숫자 아님 입력은 키 입력 단계에서 막고, 최소값 미만
+        # 입력은 fixup 이 경계값으로 고쳐 준다 (핸들러의 예외 처리 불필요)
+        self.max_edge_edit.setValidator(
+            _ClampIntValidator(
+                self.max_edge_slider.minimum(),
+                self.max_edge_slider.maximum(),
+                self.max_edge_slider.value,
+                self,
+            )
+        )
+        self.max_edge_edit.editingFinished.connect(
+            self._make_bounded_edit_handler(self.max_edge_edit, self.max_edge_slider)
+        )
 
         max_edge_row = QHBoxLayout()
         max_edge_row.setSpacing(6)
         max_edge_row.addWidget(self.max_edge_slider, 1)
         max_edge_row.addWidget(self.max_edge_edit, 0)
 
-        self.quality_label = QLabel(f"JPEG 품질: {settings.image_quality}%")
+        self.quality_label = QLabel(f"{self._QUALITY_PREFIX}{settings.image_quality}%")
         self.quality_slider = QSlider(Qt.Horizontal)
         self.quality_slider.setCursor(Qt.PointingHandCursor)
         self.quality_slider.setRange(70, 100)
@@ -254,45 +429,68 @@ class MainWindow(QMainWindow):
         self.quality_edit.setMaxLength(3)
         self.quality_edit.setFrame(True)
         self.quality_edit.setCursor(Qt.PointingHandCursor)
-        self.quality_edit.editingFinished.connect(self._on_quality_edit_finished)
+        self.quality_edit.setValidator(
+            _ClampIntValidator(
+                self.quality_slider.minimum(),
+                self.quality_slider.maximum(),
+                self.quality_slider.value,
+                self,
+            )
+        )
+        self.quality_edit.editingFinished.connect(
+            self._make_bounded_edit_handler(self.quality_edit, self.quality_slider)
+        )
 
         quality_row = QHBoxLayout()
         quality_row.setSpacing(6)
         quality_row.addWidget(self.quality_slider, 1)
         quality_row.addWidget(self.quality_edit, 0)
 
+        # valueChanged 는 드래그 중 라벨 미리보기용, 실제 디스크 커밋은
+        # 제스처가 끝나는 sliderReleased(또는 디바운스 만료) 시점에 한 번만 한다.
         self.max_edge_slider.valueChanged.connect(self._on_image_settings_changed)
         self.quality_slider.valueChanged.connect(self._on_image_settings_changed)
+        self.max_edge_slider.sliderReleased.connect(self._commit_settings)
+        self.quality_slider.sliderReleased.connect(self._commit_settings)
+
+        # 이미지 관련 컨트롤은 컨테이너 위젯 하나로 묶어서, 활성/비활성 토글 때
+        # 위젯 8개를 순회하지 않고 컨테이너 setEnabled 한 번으로 처리한다.
+        self.image_controls = QWidget()
+        image_controls_layout = QVBoxLayout(self.image_controls)
+        image_controls_layout.setContentsMargins(0, 0, 0, 0)
+        image_controls_layout.setSpacing(4)
 
-        func_layout.addWidget(self.max_edge_label)
-        func_layout.addLayout(max_edge_row)
+        image_controls_layout.addWidget(self.max_edge_label)
+        image_controls_layout.addLayout(max_edge_row)
 
         self.max_edge_hint_label = QLabel("권장: 1600 px")
-        self.max_edge_hint_label.setStyleSheet("color: #666666; font-size: 9pt;")
-        func_layout.addWidget(self.max_edge_hint_label)
+        self.max_edge_hint_label.setProperty("class", "hint")
+        image_controls_layout.addWidget(self.max_edge_hint_label)
 
-        func_layout.addWidget(self.quality_label)
-        func_layout.addLayout(quality_row)
+        image_controls_layout.addWidget(self.quality_label)
+        image_controls_layout.addLayout(quality_row)
 
         self.quality_hint_label = QLabel("권장: 80 %")
-        self.quality_hint_label.setStyleSheet("color: #666666; font-size: 9pt;")
-        func_layout.addWidget(self.quality_hint_label)
+        self.quality_hint_label.setProperty("class", "hint")
+        image_controls_layout.addWidget(self.quality_hint_label)
+
+        func_layout.addWidget(self.image_controls)
 
         func_layout.addWidget(self.precision_check)
 
         warn = QLabel("주의: 정밀 슬리머 사용 시 엑셀에서 복구 여부를 물어볼 수 있습니다.")
-        warn.setStyleSheet("color: #ff6666; font-size: 9pt;")
+        warn.setProperty("class", "warn")
         func_layout.addWidget(warn)
 
         left_layout.addWidget(func_group)
 
         # 정밀 슬리머 옵션 카드
         opt_label = QLabel("정밀 슬리머 옵션")
-        opt_label.setStyleSheet("font-weight: 600;")
+        opt_label.setProperty("class", "header")
         left_layout.addWidget(opt_label)
 
         opt_group = QGroupBox()
-        opt_group.setStyleSheet(self._card_style())
+        opt_group.setProperty("card", True)
         opt_layout = QVBoxLayout(opt_group)
         opt_layout.setSpacing(4)
 
@@ -306,27 +504,33 @@ class MainWindow(QMainWindow):
         self.aggressive_check.setFocusPolicy(Qt.NoFocus)
         self.aggressive_check.setCursor(Qt.PointingHandCursor)
 
-        opt_layout.addWidget(self.xmlcleanup_check)
-        opt_layout.addWidget(self.force_custom_check)
-        opt_layout.addWidget(self.aggressive_check)
+        # 정밀 슬리머 하위 옵션도 컨테이너로 묶어 한 번에 활성/비활성 토글한다.
+        self.precision_opts = QWidget()
+        precision_opts_layout = QVBoxLayout(self.precision_opts)
+        precision_opts_layout.setContentsMargins(0, 0, 0, 0)
+        precision_opts_layout.setSpacing(4)
+        precision_opts_layout.addWidget(self.xmlcleanup_check)
+        precision_opts_layout.addWidget(self.force_custom_check)
+        precision_opts_layout.addWidget(self.aggressive_check)
+        opt_layout.addWidget(self.precision_opts)
 
         opt_warn = QLabel("주의: 숨은 XML 데이터 삭제는 일반적인 경우 사용하지 마세요.")
-        opt_warn.setStyleSheet("color: #ff6666; font-size: 9pt;")
+        opt_warn.setProperty("class", "warn")
         opt_layout.addWidget(opt_warn)
 
         opt_warn2 = QLabel("이미지 포맷 변경 옵션은 일부 도형/특수 이미지에서 예기치 않은 영향이 있을 수 있습니다.")
-        opt_warn2.setStyleSheet("color: #ff6666; font-size: 9pt;")
+        opt_warn2.setProperty("class", "warn")
         opt_layout.addWidget(opt_warn2)
 
         left_layout.addWidget(opt_group)
 
         # 실행/상태 카드
         run_label = QLabel("진행 상태")
-        run_label.setStyleSheet("font-weight: 600;")
+        run_label.setProperty("class", "header")
         left_layout.addWidget(run_label)
 
         run_group = QGroupBox()
-        run_group.setStyleSheet(self._card_style())
+        run_group.setProperty("card", True)
         run_layout = QVBoxLayout(run_group)
         run_layout.setSpacing(8)
 
@@ -353,26 +557,53 @@ class MainWindow(QMainWindow):
 
         # 로그 카드
         log_label = QLabel("로그")
-        log_label.setStyleSheet("font-weight: 600;")
+        log_label.setProperty("class", "header")
         right_layout.addWidget(log_label)
 
         log_group = QGroupBox()
-        log_group.setStyleSheet(self._card_style())
+        log_group.setProperty("card", True)
         log_layout = QVBoxLayout(log_group)
         log_layout.setContentsMargins(8, 6, 8, 8)
         self.log_edit = QPlainTextEdit()
         self.log_edit.setReadOnly(True)
         self.log_edit.setLineWrapMode(QPlainTextEdit.NoWrap)
+        # append 전용 로그이므로 undo 스택은 필요 없고, 장시간 실행 시
+        # 로그가 무한정 쌓이지 않도록 블록 수를 제한한다.
+        self.log_edit.setUndoRedoEnabled(False)
+        self.log_edit.setCenterOnScroll(False)
+        self.log_edit.document().setMaximumBlockCount(5000)
         log_layout.addWidget(self.log_edit)
 
+        # 워커 로그를 약 30Hz로 묶어서 출력: 라인당 크로스 스레드 이벤트와
+        # 문서 재배치(relayout)가 한 번의 배치로 줄어든다.
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(33)
+        self._log_flush_timer.timeout.connect(self._flush_worker_logs)
+        self._log_flush_timer.start()
+
         right_layout.addWidget(log_group)
 
-        # 환경 설정 탭
+        self._update_precision_options_state()
+        self.precision_check.toggled.connect(self._update_precision_options_state)
+        self._update_image_controls_state()
+        self.image_check.toggled.connect(self._update_image_controls_state)
+
+        self._apply_global_widget_style()
+
+    def _ensure_settings_built(self, index: int) -> None:
+        if self._settings_built or self.tabs.widget(index) is not self.settings_tab:
+            return
+        self._settings_built = True
+        self._build_settings_tab()
+
+    def _build_settings_tab(self) -> None:
+        """환경 설정 탭의 위젯들을 실제로 구성한다 (첫 진입 시 1회)."""
+
         s_layout = QVBoxLayout(self.settings_tab)
         s_layout.setContentsMargins(12, 12, 12, 12)
         s_layout.setSpacing(12)
 
-        settings = get_settings()
+        settings = self._settings
 
         # 너무 가로로 넓어지지 않도록, 가운데에 최대 폭이 제한된 컨테이너를 둔다.
         settings_container = QWidget()
@@ -384,10 +615,10 @@ class MainWindow(QMainWindow):
 
         # 경로/백업/출력 폴더 설정 카드
         path_label = QLabel("경로 설정")
-        path_label.setStyleSheet("font-weight: 600;")
+        path_label.setProperty("class", "header")
 
         path_group = QGroupBox()
-        path_group.setStyleSheet(self._card_style())
+        path_group.setProperty("card", True)
         path_layout = QVBoxLayout(path_group)
         path_layout.setSpacing(6)
 
@@ -397,7 +628,7 @@ class MainWindow(QMainWindow):
         self.keep_backup_check.setChecked(settings.keep_backup)
         self.keep_backup_check.toggled.connect(self._on_keep_backup_toggled)
         hint = QLabel("기본값: OFF (원본 파일은 덮어쓰지 않으므로 일반적으로는 필요 없습니다.)")
-        hint.setStyleSheet("color: #666666; font-size: 9pt;")
+        hint.setProperty("class", "hint")
 
         out_label = QLabel("완성본 저장 폴더:")
         self.output_dir_edit = QLineEdit()
@@ -433,10 +664,10 @@ class MainWindow(QMainWindow):
 
         # 로그 설정 카드 (로그 상세도 / 오류 시 로그 폴더 자동 열기)
         log_label = QLabel("로그 설정")
-        log_label.setStyleSheet("font-weight: 600;")
+        log_label.setProperty("class", "header")
 
         log_settings_group = QGroupBox()
-        log_settings_group.setStyleSheet(self._card_style())
+        log_settings_group.setProperty("card", True)
         log_settings_layout = QVBoxLayout(log_settings_group)
         log_settings_layout.setSpacing(6)
 
@@ -461,10 +692,10 @@ class MainWindow(QMainWindow):
 
         # UI 설정 카드 (다크 모드)
         ui_label = QLabel("다크 모드 설정")
-        ui_label.setStyleSheet("font-weight: 600;")
+        ui_label.setProperty("class", "header")
 
         ui_group = QGroupBox()
-        ui_group.setStyleSheet(self._card_style())
+        ui_group.setProperty("card", True)
         ui_layout = QVBoxLayout(ui_group)
         ui_layout.setSpacing(6)
 
@@ -483,21 +714,20 @@ class MainWindow(QMainWindow):
 
         s_layout.addWidget(settings_container, 0, Qt.AlignTop | Qt.AlignHCenter)
 
-        self._update_precision_options_state()
-        self.precision_check.toggled.connect(self._update_precision_options_state)
-        self._update_image_controls_state()
-        self.image_check.toggled.connect(self._update_image_controls_state)
+    def _commit_settings(self) -> None:
+        """디바운스 만료 또는 슬라이더 제스처 종료 시 현재 설정을 기록한다."""
 
-        self._apply_global_widget_style()
+        self._settings_debounce.stop()
+        save_settings(self._settings)
 
     def _on_keep_backup_toggled(self, checked: bool) -> None:
-        settings = get_settings()
+        settings = self._settings
         settings.keep_backup = bool(checked)
-        save_settings(settings)
+        self._settings_debounce.start()
 
     def _on_change_output_dir(self) -> None:
-        settings = get_settings()
-        start_dir = settings.output_dir or str(Path.home() / "Desktop")
+        settings = self._settings
+        start_dir = settings.output_dir or self._default_browse_dir
         directory = QFileDialog.getExistingDirectory(
             self,
             "완성본 저장 폴더 선택",
@@ -509,395 +739,134 @@ class MainWindow(QMainWindow):
             self.output_dir_edit.setText(directory)
 
     def _on_reset_output_dir(self) -> None:
-        settings = get_settings()
+        settings = self._settings
         settings.output_dir = ""
         save_settings(settings)
         self.output_dir_edit.clear()
         self.output_dir_edit.setPlaceholderText("기본 위치 사용 (ExcelSlimmed 폴더)")
 
     def _on_image_settings_changed(self) -> None:
-        settings = get_settings()
+        settings = self._settings
         settings.image_max_edge = self.max_edge_slider.value()
         settings.image_quality = self.quality_slider.value()
-        save_settings(settings)
-        self.max_edge_label.setText(f"최대 해상도 (px): {settings.image_max_edge}")
-        self.quality_label.setText(f"JPEG 품질: {settings.image_quality}%")
-        self.max_edge_edit.setText(str(settings.image_max_edge))
-        self.quality_edit.setText(str(settings.image_quality))
+        # 라벨 갱신은 즉시, 디스크 기록은 디바운스 타이머에 맡긴다.
+        self._settings_debounce.start()
+        # 값이 실제로 바뀐 위젯만 setText 해서 드래그 중 불필요한
+        # 텍스트 레이아웃 무효화를 피한다.
+        new_max_edge = f"{self._MAX_EDGE_PREFIX}{settings.image_max_edge}"
+        if self.max_edge_label.text() != new_max_edge:
+            self.max_edge_label.setText(new_max_edge)
+        new_quality = f"{self._QUALITY_PREFIX}{settings.image_quality}%"
+        if self.quality_label.text() != new_quality:
+            self.quality_label.setText(new_quality)
+        max_edge_str = str(settings.image_max_edge)
+        if self.max_edge_edit.text() != max_edge_str:
+            self.max_edge_edit.setText(max_edge_str)
+        quality_str = str(settings.image_quality)
+        if self.quality_edit.text() != quality_str:
+            self.quality_edit.setText(quality_str)
 
     def _on_log_settings_changed(self) -> None:
-        settings = get_settings()
+        settings = self._settings
         settings.log_mode = "verbose" if self.verbose_check.isChecked() else "minimal"
         settings.open_log_on_error = self.open_log_on_error_check.isChecked()
-        save_settings(settings)
+        self._settings_debounce.start()
 
     def _on_dark_mode_toggled(self, checked: bool) -> None:
-        settings = get_settings()
+        settings = self._settings
         settings.theme = "dark" if checked else "light"
         save_settings(settings)
         self._theme = settings.theme
-        self._apply_global_widget_style()
         self._refresh_card_styles()
 
-    def _card_style(self) -> str:
-        theme = getattr(self, "_theme", "light")
-        if theme == "dark":
-            # 다크 모드에서는 전체 배경보다 살짝 밝은 회색 카드 배경을 사용
-            # 개별 QGroupBox 위젯에 직접 적용되도록 셀렉터 없이 스타일을 반환한다.
-            return (
-                "background-color: #222426;"  # 메인보다 약간 밝은 다크 그레이
-                "border: 0px;"               # 테두리는 없애고 배경만 유지
-                "border-radius: 4px;"
-                "margin-top: 0px;"
-            )
-        # 라이트 모드 기본 카드 스타일
-        return (
-            "background-color: #ffffff;"
-            "border: 0px;"               # 테두리는 없애고 배경만 유지
-            "border-radius: 4px;"
-            "margin-top: 0px;"
-        )
-
     def _apply_global_widget_style(self) -> None:
-        """Apply a theme-aware, uniform border to inputs and buttons."""
-
-        theme = getattr(self, "_theme", "light")
-        if theme == "dark":
-            # 모던 브라우저와 비슷한 부드러운 다크 테마
-            # 전체 배경은 짙은 회색(#1c1e21), 카드(QGroupBox)는 약간 더 밝은 회색(#222426)을 사용
-            # 내부 텍스트 위젯(QLineEdit, QPlainTextEdit)은 기본 상태에서 박스 없이 카드 배경 위의 글씨처럼 보이게 한다.
-            # 체크박스는 파란 배경(#5b8cff)에 흰색 체크 아이콘(check_white.svg)이 보이도록 설정한다.
-            checkbox_checked_icon = str(Path(__file__).resolve().parent / "check_white.svg").replace("\\", "/")
-            self.setStyleSheet(
-                "* {"
-                "  border: 0px;"
-                "}"
-                "QWidget {"
-                "  background: #1c1e21;"   # 전체 배경 (짙은 회색)
-                "  color: #f5f5f5;"        # 눈이 편한 거의 흰색 텍스트
-                "}"
-                "QTabWidget::pane {"
-                "  border: 0px;"           # 탭 내용 영역 외곽 박스 제거
-                "}"
-                "QLineEdit {"
-                "  background: transparent;"
-                "  color: #f5f5f5;"
-                "  border: 0px;"
-                "  padding: 3px 6px;"
-                "}"
-                "QLineEdit[readOnly=\"true\"] {"
-                "  background: transparent;"
-                "  border: 0px;"
-                "}"
-                "QLineEdit:focus {"
-                "  background: transparent;"  # 포커스 시에도 테두리 박스를 만들지 않는다
-                "  border: 0px;"
-                "}"
-                "QPlainTextEdit {"
-                "  background: transparent;"
-                "  color: #f5f5f5;"
-                "  border: 0px;"
-                "}"
-                "QPlainTextEdit:focus {"
-                "  background: transparent;"
-                "  border: 0px;"
-                "}"
-                "QPlainTextEdit[readOnly=\"true\"] {"
-                "  background: transparent;"
-                "  border: 0px;"
-                "}"
-                "QLineEdit#file_path_edit,"
-                "QLineEdit#max_edge_edit,"
-                "QLineEdit#quality_edit,"
-                "QLineEdit#output_dir_edit {"
-                "  background: #25272b;"
-                "  border: 1px solid #858a96;"  # 다크 모드에서 눈에 잘 보이는 연한 회색 테두리
-                "  border-radius: 4px;"
-                "  padding: 3px 6px;"
-                "}"
-                "QLineEdit#file_path_edit:focus,"
-                "QLineEdit#max_edge_edit:focus,"
-                "QLineEdit#quality_edit:focus,"
-                "QLineEdit#output_dir_edit:focus {"
-                "  border: 1px solid #bfc5d4;"  # 포커스 시 살짝 더 밝은 회색/파랑 톤
-                "}"
-                "QProgressBar {"
-                "  border: 0px;"           # 진행바 외곽 박스 제거
-                "  background: #222426;"   # 카드 배경과 자연스럽게 맞춤
-                "  text-align: center;"
-                "}"
-                "QProgressBar::chunk {"
-                "  background-color: #5b8cff;"
-                "  border-radius: 2px;"
-                "}"
-                "QPushButton {"
-                "  border: 1px solid #858a96;"  # 버튼도 동일한 연한 회색 테두리
-                "  border-radius: 4px;"
-                "  padding: 4px 10px;"
-                "  background: #2b2f36;"
-                "}"
-                "QPushButton:hover {"
-                "  background: #383c42;"
-                "}"
-                "QPushButton:pressed {"
-                "  background: #42474e;"
-                "}"
-                "QCheckBox {"
-                "  spacing: 6px;"
-                "}"
-                "QCheckBox::indicator {"
-                "  width: 16px;"
-                "  height: 16px;"
-                "  border-radius: 3px;"
-                "  border: 1px solid #70757d;"
-                "  background: #25272b;"
-                "}"
-                "QCheckBox::indicator:hover {"
-                "  border-color: #82aaff;"
-                "}"
-                "QCheckBox::indicator:checked {"
-                "  background: #5b8cff;"   # 파란색으로 꽉 찬 체크 박스
-                "  border-color: #5b8cff;"
-                f"  image: url('{checkbox_checked_icon}');"
-                "}"
-                "QCheckBox:focus {"
-                "  outline: none;"          # 체크박스 줄 전체를 감싸는 포커스 테두리 제거
-                "}"
-            )
-        else:
-            # 라이트 모드에서는 전체를 흰 배경 위에 평평하게 두되,
-            # 텍스트 입력/로그 영역은 기본 상태에서 박스 없이 글씨만 보이도록 한다.
-            # 체크박스는 파란 배경(#5b8cff)에 흰색 체크 아이콘(check_white.svg)이 보이도록 설정한다.
-            checkbox_checked_icon = str(Path(__file__).resolve().parent / "check_white.svg").replace("\\", "/")
-            self.setStyleSheet(
-                "* {"
-                "  border: 0px;"
-                "}"
-                "QTabWidget::pane {"
-                "  border: 0px;"           # 탭 내용 영역 외곽 박스 제거
-                "}"
-                "QLineEdit {"
-                "  background: transparent;"
-                "  border: 0px;"
-                "  padding: 3px 6px;"
-                "}"
-                "QLineEdit[readOnly=\"true\"] {"
-                "  background: transparent;"
-                "  border: 0px;"
-                "}"
-                "QLineEdit:focus {"
-                "  border: 0px;"
-                "  background: transparent;"
-                "}"
-                "QPlainTextEdit {"
-                "  background: transparent;"
-                "  border: 0px;"
-                "}"
-                "QPlainTextEdit:focus {"
-                "  background: transparent;"
-                "  border: 0px;"
-                "}"
-                "QPlainTextEdit[readOnly=\"true\"] {"
-                "  background: transparent;"
-                "  border: 0px;"
-                "}"
-                "QLineEdit#file_path_edit,"
-                "QLineEdit#max_edge_edit,"
-                "QLineEdit#quality_edit,"
-                "QLineEdit#output_dir_edit {"
-                "  background: #ffffff;"
-                "  border: 1px solid #d0d0d0;"  # 라이트 모드에서 자연스러운 연한 회색 테두리
-                "  border-radius: 4px;"
-                "  padding: 3px 6px;"
-                "}"
-                "QLineEdit#file_path_edit:focus,"
-                "QLineEdit#max_edge_edit:focus,"
-                "QLineEdit#quality_edit:focus,"
-                "QLineEdit#output_dir_edit:focus {"
-                "  border: 1px solid #5b8cff;"  # 포커스 시만 살짝 파란색으로 강조
-                "}"
-                "QProgressBar {"
-                "  border: 0px;"           # 진행바 외곽 박스 제거
-                "  background: #f0f0f0;"
-                "  text-align: center;"
-                "}"
-                "QProgressBar::chunk {"
-                "  background-color: #5b8cff;"
-                "  border-radius: 2px;"
-                "}"
-                "QCheckBox {"
-                "  spacing: 6px;"
-                "}"
-                "QCheckBox::indicator {"
-                "  width: 16px;"
-                "  height: 16px;"
-                "  border-radius: 3px;"
-                "  border: 1px solid #b0b0b0;"
-                "  background: #ffffff;"
-                "}"
-                "QCheckBox::indicator:hover {"
-                "  border-color: #5b8cff;"
-                "}"
-                "QCheckBox::indicator:checked {"
-                "  background: #5b8cff;"   # 라이트 모드에서도 파란색으로 꽉 찬 체크 박스
-                "  border-color: #5b8cff;"
-                f"  image: url('{checkbox_checked_icon}');"
-                "}"
-                "QCheckBox:focus {"
-                "  outline: none;"          # 체크박스 줄 전체를 감싸는 포커스 테두리 제거
-                "}"
-                "QPushButton {"
-                "  border: 1px solid #d0d0d0;"  # 버튼도 동일한 연한 회색 테두리
-                "  border-radius: 4px;"
-                "  padding: 4px 10px;"
-                "  background: #ffffff;"
-                "}"
-                "QPushButton:hover {"
-                "  background: #f5f5f5;"
-                "}"
-                "QPushButton:pressed {"
-                "  background: #eaeaea;"
-                "}"
-            )
-
-        if theme == "dark":
-            # 다크 모드: 1px 연한 회색 테두리
-            input_style = (
-                "background: #25272b;"
-                "border: 1px solid #858a96;"
-                "border-radius: 4px;"
-                "padding: 3px 6px;"
-            )
-            button_style = (
-                "border: 1px solid #858a96;"
-                "border-radius: 4px;"
-                "padding: 4px 10px;"
-                "background: #2b2f36;"
-            )
-        else:
-            # 라이트 모드: 1px 연한 회색 테두리
-            input_style = (
-                "background: #ffffff;"
-                "border: 1px solid #d0d0d0;"
-                "border-radius: 4px;"
-                "padding: 3px 6px;"
-            )
-            button_style = (
-                "border: 1px solid #d0d0d0;"
-                "border-radius: 4px;"
-                "padding: 4px 10px;"
-                "background: #ffffff;"
-            )
+        """Apply a theme-aware, uniform border to inputs and buttons.
 
-        for edit in (
-            self.file_edit,
-            self.max_edge_edit,
-            self.quality_edit,
-            self.output_dir_edit,
-        ):
-            edit.setStyleSheet(input_style)
+        입력창(objectName 셀렉터)과 버튼 스타일은 전역 QSS가 모두 담당하므로
+        여기서 개별 위젯을 순회하며 setStyleSheet 할 필요가 없다.
+        """
 
-        for btn in self.findChildren(QPushButton):
-            btn.setStyleSheet(button_style)
+        theme = getattr(self, "_theme", "light")
+        # 테마별 QSS 파일은 __init__에서 한 번만 읽어 둔 캐시를 그대로 적용한다.
+        self.setStyleSheet(self._qss.get(theme, self._qss["light"]))
 
     def _refresh_card_styles(self) -> None:
         """Re-apply card styles for the current theme.
 
-        QGroupBox 들은 생성 시점에만 _card_style()을 적용하므로,
-        테마를 전환할 때는 전체 그룹박스에 대해 스타일을 다시 입혀준다.
+        카드 스타일은 전역 스타일시트의 QGroupBox[card="true"] 셀렉터가
+        담당하므로, 그룹박스를 순회하지 않고 전역 스타일만 다시 적용한 뒤
+        polish 로 셀렉터 매칭을 갱신한다.
         """
 
-        style = self._card_style()
-        for group in self.findChildren(QGroupBox):
-            group.setStyleSheet(style)
+        self._apply_global_widget_style()
+        self.style().polish(self)
 
     def _update_precision_options_state(self) -> None:
         enabled = self.precision_check.isChecked()
-        for cb in (self.aggressive_check, self.xmlcleanup_check, self.force_custom_check):
-            if not enabled:
+        if not enabled:
+            for cb in (self.aggressive_check, self.xmlcleanup_check, self.force_custom_check):
                 cb.setChecked(False)
-            cb.setEnabled(enabled)
+        # 비활성 전파는 Qt가 C++ 레벨에서 자식들에게 해 주므로 컨테이너만 토글한다.
+        self.precision_opts.setEnabled(enabled)
 
     def _update_image_controls_state(self) -> None:
-        enabled = self.image_check.isChecked()
-        for w in (
-            self.max_edge_label,
-            self.max_edge_slider,
-            self.max_edge_edit,
-            self.max_edge_hint_label,
-            self.quality_label,
-            self.quality_slider,
-            self.quality_edit,
-            self.quality_hint_label,
-        ):
-            w.setEnabled(enabled)
+        self.image_controls.setEnabled(self.image_check.isChecked())
 
-    def _on_max_edge_edit_finished(self) -> None:
-        text = self.max_edge_edit.text().strip()
-        if not text:
-            # 빈 입력이면 현재 슬라이더 값으로 복구
-            self.max_edge_edit.setText(str(self.max_edge_slider.value()))
-            return
-        try:
-            value = int(text)
-        except ValueError:
-            QMessageBox.warning(self, "입력 오류", "숫자만 입력 가능합니다.")
-            self.max_edge_edit.setText(str(self.max_edge_slider.value()))
-            return
+    def _make_bounded_edit_handler(self, edit, slider):
+        """숫자 편집창 ↔ 슬라이더 동기화 핸들러를 만들어 준다.
 
-        min_v = self.max_edge_slider.minimum()
-        max_v = self.max_edge_slider.maximum()
-        if value < min_v:
-            QMessageBox.warning(self, "입력 범위", f"최소 {min_v}까지 가능합니다.")
-            value = min_v
-        elif value > max_v:
-            QMessageBox.warning(self, "입력 범위", f"최대 {max_v}까지 가능합니다.")
-            value = max_v
-
-        self.max_edge_slider.setValue(value)
-
-    def _on_quality_edit_finished(self) -> None:
-        text = self.quality_edit.text().strip()
-        if not text:
-            self.quality_edit.setText(str(self.quality_slider.value()))
-            return
-        try:
-            value = int(text)
-        except ValueError:
-            QMessageBox.warning(self, "입력 오류", "숫자만 입력 가능합니다.")
-            self.quality_edit.setText(str(self.quality_slider.value()))
-            return
+        해상도/품질 편집창이 완전히 같은 로직을 쓰므로 클로저 하나로 공유한다.
+        _ClampIntValidator 의 fixup 이 빈 입력까지 포함해 모든 입력을 유효한
+        숫자로 고쳐 놓은 뒤에만 editingFinished 가 emit 되므로, 여기서는
+        예외 처리나 복구 로직 없이 바로 적용하면 된다.
+        """
 
-        min_v = self.quality_slider.minimum()
-        max_v = self.quality_slider.maximum()
-        if value < min_v:
-            QMessageBox.warning(self, "입력 범위", f"최소 {min_v}까지 가능합니다.")
-            value = min_v
-        elif value > max_v:
-            QMessageBox.warning(self, "입력 범위", f"최대 {max_v}까지 가능합니다.")
-            value = max_v
+        def handler() -> None:
+            # setValue 가 valueChanged 를 되쏘면서 방금 입력한 편집창을 다시
+            # 덮어쓰는 핑퐁을 막고, 동기화는 핸들러를 직접 호출해서 한 번만 한다.
+            with QSignalBlocker(slider):
+                slider.setValue(int(edit.text()))
+            self._on_image_settings_changed()
 
-        self.quality_slider.setValue(value)
+        return handler
 
     def _on_browse(self) -> None:
-        # 기본 경로를 바탕 화면으로 지정 (없으면 기본값 사용)
-        default_dir = Path.home() / "Desktop"
-        start_dir = str(default_dir) if default_dir.exists() else ""
-
+        # 시작 폴더는 __init__에서 캐시해 둔 바탕 화면 경로를 사용하고,
+        # 옵션을 따로 주지 않아 OS 네이티브 파일 선택창이 뜨게 한다.
         path, _ = QFileDialog.getOpenFileName(
             self,
             "대상 Excel 파일 선택",
-            start_dir,
+            self._default_browse_dir,
             "Excel Files (*.xlsx *.xlsm)",
         )
         if path:
             self.file_edit.setText(path)
 
     def _append_log(self, text: str) -> None:
+        # appendPlainText 는 뷰가 맨 아래에 있을 때 자동으로 따라 내려가므로
+        # 수동 스크롤 처리가 필요 없다 (사용자가 위로 올려 둔 경우는 그대로 유지).
         self.log_edit.appendPlainText(text)
-        self.log_edit.verticalScrollBar().setValue(self.log_edit.verticalScrollBar().maximum())
+
+    def _flush_worker_logs(self) -> None:
+        worker = self._worker
+        if worker is None:
+            return
+        batch = worker.take_pending_logs()
+        if batch:
+            self._append_log("\n".join(batch))
 
     def _set_status(self, text: str, progress: float | None = None) -> None:
+        # 최신 값만 보관하고 타이머 만료 시점에 한 번만 위젯을 건드린다.
+        # 타이머가 이미 돌고 있으면 값만 덮어써서 중간 갱신을 합쳐 버린다.
+        self._pending_status = (text, progress)
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _apply_pending_status(self) -> None:
+        if self._pending_status is None:
+            return
+        text, progress = self._pending_status
+        self._pending_status = None
         self.status_label.setText(text)
         if progress is not None:
             self.progress_bar.setValue(int(progress))
@@ -905,14 +874,21 @@ class MainWindow(QMainWindow):
     def _reset_ui_after_finish(self) -> None:
         """파이프라인 완료 후 기본 상태로 되돌립니다 (로그는 유지)."""
         self.file_edit.clear()
-        # 초기 모드: 실행할 기능은 아무것도 선택하지 않은 상태
-        self.clean_check.setChecked(False)
-        self.image_check.setChecked(False)
-        self.precision_check.setChecked(False)
-        self.aggressive_check.setChecked(False)
-        self.xmlcleanup_check.setChecked(False)
-        self.force_custom_check.setChecked(False)
+        # 초기 모드: 실행할 기능은 아무것도 선택하지 않은 상태.
+        # 체크 해제마다 toggled 핸들러가 연쇄 실행되지 않도록 시그널을 막고
+        # 일괄 해제한 뒤, 파생 상태 갱신은 마지막에 한 번씩만 한다.
+        for cb in (
+            self.clean_check,
+            self.image_check,
+            self.precision_check,
+            self.aggressive_check,
+            self.xmlcleanup_check,
+            self.force_custom_check,
+        ):
+            with QSignalBlocker(cb):
+                cb.setChecked(False)
         self._update_precision_options_state()
+        self._update_image_controls_state()
         self.progress_bar.setValue(0)
         self.status_label.setText("준비됨")
 
@@ -925,7 +901,7 @@ class MainWindow(QMainWindow):
         if not path.exists():
             QMessageBox.critical(self, "오류", f"파일을 찾을 수 없습니다:\n{path}")
             return
-        if path.suffix.lower() not in (".xlsx", ".xlsm"):
+        if path.suffix.lower() not in _ALLOWED_SUFFIXES:
             QMessageBox.critical(self, "오류", "지원 형식은 .xlsx / .xlsm 입니다.")
             return
         if not (
@@ -950,6 +926,14 @@ class MainWindow(QMainWindow):
         self.status_label.setText("작업 시작...")
         self.run_button.setEnabled(False)
 
+        if getattr(sys, "frozen", False):
+            # PyInstaller 빌드에서는 자식 프로세스 spawn이 실행 파일을 다시 띄우는
+            # 문제가 있어 기존 QThread 경로를 그대로 사용한다.
+            self._start_pipeline_thread(path)
+        else:
+            self._start_pipeline_process(path)
+
+    def _start_pipeline_thread(self, path: Path) -> None:
         worker = PipelineWorker(
             path=path,
             use_clean=self.clean_check.isChecked(),
@@ -959,53 +943,157 @@ class MainWindow(QMainWindow):
             do_xml_cleanup=self.xmlcleanup_check.isChecked(),
             force_custom=self.force_custom_check.isChecked(),
         )
-        worker.log.connect(self._append_log)
-        worker.status.connect(self._set_status)
-
-        def on_finished(final_path: str) -> None:
-            self._set_status("모든 작업 완료", 100.0)
-            self.run_button.setEnabled(True)
-            QMessageBox.information(
-                self,
-                "완료",
-                f"모든 작업이 완료되었습니다.\n\n최종 결과 파일:\n{final_path}",
-            )
-            # 탐색기 열기는 별도 스레드에서 실행해 UI 블로킹을 방지합니다.
-            try:
-                threading.Thread(
-                    target=open_in_explorer_select,
-                    args=(Path(final_path),),
-                    daemon=True,
-                ).start()
-            except Exception:
-                # 탐색기 열기 실패는 치명적이지 않으므로 조용히 무시합니다.
-                pass
-            # 로그는 유지하고 나머지 UI 상태만 초기화합니다.
-            self._reset_ui_after_finish()
-
-        def on_failed(msg: str) -> None:
-            self.run_button.setEnabled(True)
-            self._set_status("오류 발생", None)
-            QMessageBox.critical(self, "오류", msg)
-
-        worker.finished.connect(on_finished)
-        worker.failed.connect(on_failed)
-
-        # QThread 대신 표준 Python 스레드를 사용해 파이프라인 코어를 실행한다.
-        # Qt 객체 생성/소멸은 모두 메인 스레드에서만 일어나고, 백그라운드에서는
-        # PipelineWorker.run 이 순수 파이썬 코드와 시그널 emit만 수행한다.
-        thread = threading.Thread(target=worker.run, daemon=True)
+        # 워커는 항상 다른 스레드에서 emit 하므로, AutoConnection 의 emit 시점
+        # 스레드 판별을 생략하도록 큐드 커넥션을 명시한다.
+        worker.progress.connect(self.progress_bar.setValue, Qt.QueuedConnection)
+        worker.status_text.connect(self.status_label.setText, Qt.QueuedConnection)
+        worker.finished.connect(self._on_pipeline_finished, Qt.QueuedConnection)
+        worker.failed.connect(self._on_pipeline_failed, Qt.QueuedConnection)
+
+        # 워커를 QThread로 옮겨서 Qt 이벤트 루프가 시그널을 직접 전달하게 한다.
+        # 이렇게 하면 파이썬 스레드를 거치지 않고 큐드 커넥션으로 로그/상태가
+        # 전달되므로 대용량 파일 처리 중에도 UI 갱신이 부드럽다.
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
         thread.start()
 
         self._worker_thread = thread
         self._worker = worker
 
+    def _start_pipeline_process(self, path: Path) -> None:
+        if self._manager is None:
+            self._manager = multiprocessing.Manager()
+
+        # 디바운스 중인 저장이 있으면 먼저 기록해 디스크와 메모리를 맞추고,
+        # 자식에는 디스크가 아니라 현재 설정 스냅샷을 그대로 실어 보낸다.
+        self._commit_settings()
+
+        options = {
+            "use_clean": self.clean_check.isChecked(),
+            "use_image": self.image_check.isChecked(),
+            "use_precision": self.precision_check.isChecked(),
+            "aggressive": self.aggressive_check.isChecked(),
+            "do_xml_cleanup": self.xmlcleanup_check.isChecked(),
+            "force_custom": self.force_custom_check.isChecked(),
+        }
+        self._events = self._manager.Queue()
+        # 실행마다 전용 데몬 프로세스를 띄운다. terminate() 가 가능해
+        # 창을 닫을 때 진행 중인 파이프라인을 즉시 끝낼 수 있다.
+        self._proc = multiprocessing.Process(
+            target=_run_pipeline_in_process,
+            args=(str(path), options, self._settings, self._events),
+            daemon=True,
+        )
+        self._proc.start()
+        self._event_drain_timer.start()
+
+    def _drain_pipeline_events(self) -> None:
+        if self._events is None:
+            return
+        while True:
+            try:
+                event = self._events.get_nowait()
+            except queue.Empty:
+                break
+            kind = event[0]
+            if kind == "log":
+                self._append_log(event[1])
+            elif kind == "status":
+                self._set_status(event[1], event[2])
+            elif kind == "finished":
+                self._event_drain_timer.stop()
+                self._proc = None
+                self._on_pipeline_finished(event[1])
+            elif kind == "failed":
+                self._event_drain_timer.stop()
+                self._proc = None
+                self._on_pipeline_failed(event[1])
+
+        # 자식이 완료/실패 이벤트 없이 죽은 경우(크래시 등)에도 UI 를 복구한다.
+        # 정상 종료라면 큐에 남긴 이벤트가 위에서 먼저 처리되어 여기 오지 않는다.
+        if (
+            self._event_drain_timer.isActive()
+            and self._proc is not None
+            and not self._proc.is_alive()
+        ):
+            self._event_drain_timer.stop()
+            exitcode = self._proc.exitcode
+            self._proc = None
+            self._on_pipeline_failed(
+                f"작업 프로세스가 예기치 않게 종료되었습니다 (종료 코드 {exitcode})."
+            )
+
+    def _on_pipeline_finished(self, final_path: str) -> None:
+        # 워커가 사라지기 전에 남아 있는 로그를 마저 출력한다.
+        self._flush_worker_logs()
+        self._worker = None
+        self._worker_thread = None
+        self._set_status("모든 작업 완료", 100.0)
+        self.run_button.setEnabled(True)
+        QMessageBox.information(
+            self,
+            "완료",
+            f"모든 작업이 완료되었습니다.\n\n최종 결과 파일:\n{final_path}",
+        )
+        # open_in_explorer_select 가 Popen 기반(논블로킹)이라 스레드로
+        # 감쌀 필요 없이 바로 호출해도 UI가 멈추지 않습니다.
+        try:
+            from excel_suite_pipeline import open_in_explorer_select
+
+            open_in_explorer_select(Path(final_path))
+        except Exception:
+            # 탐색기 열기 실패는 치명적이지 않으므로 조용히 무시합니다.
+            pass
+        # 로그는 유지하고 나머지 UI 상태만 초기화합니다.
+        self._reset_ui_after_finish()
+
+    def _on_pipeline_failed(self, msg: str) -> None:
+        self._flush_worker_logs()
+        self._worker = None
+        self._worker_thread = None
+        self.run_button.setEnabled(True)
+        self._set_status("오류 발생", None)
+        QMessageBox.critical(self, "오류", msg)
+
+    def closeEvent(self, event) -> None:
+        # 디바운스 대기 중인 설정 저장이 있으면 창이 닫히기 전에 마저 기록한다.
+        if self._settings_debounce.isActive():
+            self._commit_settings()
+        # QThread 가 창의 자식이라, 실행 중인 채로 창과 함께 파괴되면 Qt가
+        # qFatal("Destroyed while thread is still running")로 죽는다.
+        # 이벤트 루프를 멈추고 잠깐 기다린 뒤, run_pipeline_core 는 중단
+        # 지점이 없으므로 안 끝나면 최후 수단으로 강제 종료한다
+        # (프로세스 자체가 곧 내려가는 시점이라 안전하다).
+        thread = self._worker_thread
+        if thread is not None and thread.isRunning():
+            thread.quit()
+            if not thread.wait(2000):
+                thread.terminate()
+                thread.wait()
+        # 진행 중인 파이프라인 프로세스는 바로 끝낸다. shutdown 류의 정중한
+        # 종료는 실행 중인 작업을 기다리므로 창만 사라지고 프로세스가 남는다.
+        if self._proc is not None and self._proc.is_alive():
+            self._proc.terminate()
+        super().closeEvent(event)
+
 
 def main() -> None:
     app = QApplication(sys.argv)
-    # 사무용에 적합하면서도 너무 딱딱하지 않은 기본 폰트 설정
-    # 맑은 고딕이 설치되지 않은 환경에서는 Qt가 자동으로 대체 폰트를 사용합니다.
-    app.setFont(QFont("맑은 고딕", 10))
+    # 사무용에 적합하면서도 너무 딱딱하지 않은 기본 폰트 설정.
+    # 대체 폰트 목록을 미리 등록해 두면 맑은 고딕이 없는 환경에서도
+    # Qt가 폰트 데이터베이스 전체를 훑지 않고 바로 다음 후보로 넘어갑니다.
+    QFont.insertSubstitutions(
+        "맑은 고딕",
+        ["Malgun Gothic", "Microsoft YaHei", "Noto Sans CJK KR", "Segoe UI"],
+    )
+    font = QFont("맑은 고딕", 10)
+    font.setStyleStrategy(QFont.PreferAntialias)
+    app.setFont(font)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from PIL import Image, ImageDraw
@@ -12,6 +14,22 @@ def create_icon(base_dir: Path) -> None:
     그리고 하단 모서리의 작은 반짝임 포인트를 그린다.
     """
 
+    png_path = base_dir / "ExcelSlimmer.png"
+    ico_path = base_dir / "ExcelSlimmer.ico"
+    hash_path = base_dir / "ExcelSlimmer.icon.hash"
+
+    # 아이콘은 이 스크립트가 그리는 대로 결정되므로, 스크립트 소스의 해시가
+    # 지난 실행과 같고 결과 파일이 모두 남아 있으면 다시 그릴 필요가 없다.
+    source_hash = hashlib.blake2b(Path(__file__).read_bytes()).hexdigest()[:16]
+    if (
+        png_path.exists()
+        and ico_path.exists()
+        and hash_path.exists()
+        and hash_path.read_text(encoding="utf-8").strip() == source_hash
+    ):
+        print(f"Icon up to date (hash {source_hash}), skipping.")
+        return
+
     size = 256
 
     # 투명 배경 캔버스
@@ -85,16 +103,28 @@ def create_icon(base_dir: Path) -> None:
     draw.polygon(star_points, fill=star_color)
 
     # PNG/ICO로 저장
-    png_path = base_dir / "ExcelSlimmer.png"
-    ico_path = base_dir / "ExcelSlimmer.ico"
-
-    img.save(png_path, format="PNG")
-    # 여러 해상도를 포함한 ICO 생성
-    img.save(
-        ico_path,
-        format="ICO",
-        sizes=[(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)],
-    )
+    def save_png() -> None:
+        img.save(png_path, format="PNG", optimize=True, compress_level=6)
+
+    def save_ico() -> None:
+        # 256 마스터를 한 번만 그리고, 나머지 해상도는 LANCZOS 다운샘플로 만든
+        # 피라미드를 ICO에 그대로 넣는다 (PIL이 내부에서 다시 리샘플하지 않도록).
+        ico_sizes = (128, 64, 48, 32, 16)
+        pyramid = [img.resize((s, s), Image.LANCZOS) for s in ico_sizes]
+        img.save(
+            ico_path,
+            format="ICO",
+            sizes=[(256, 256), *((s, s) for s in ico_sizes)],
+            append_images=pyramid,
+        )
+
+    # PNG/ICO 인코딩+쓰기는 서로 독립적이고 PIL 인코더는 C 레벨에서 GIL을
+    # 놓으므로, 스레드 두 개로 돌리면 두 저장이 실제로 겹쳐서 진행된다.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        for future in [pool.submit(save_png), pool.submit(save_ico)]:
+            future.result()
+
+    hash_path.write_text(source_hash, encoding="utf-8")
 
     print(f"Saved PNG: {png_path}")
     print(f"Saved ICO: {ico_path}")
@@ -93,3 +93,15 @@ def get_settings() -> AppSettings:
     if _settings_cache is None:
         _settings_cache = load_settings()
     return _settings_cache
+
+
+def set_settings(settings: AppSettings) -> None:
+    """설정 캐시를 주어진 객체로 교체한다.
+
+    파이프라인 워커 프로세스에 부모의 설정 스냅샷을 주입할 때 사용한다.
+    풀의 프로세스는 실행 간에 재사용되므로, 주입하지 않으면 첫 실행 때
+    채워진 캐시가 이후 실행에서도 그대로 쓰인다.
+    """
+
+    global _settings_cache
+    _settings_cache = settings